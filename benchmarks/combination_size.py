@@ -0,0 +1,56 @@
+"""Benchmark of predict latency and accuracy by combination size."""
+import itertools
+import time
+from typing import List, Tuple
+
+from wbn.classifier import WBN
+from wbn.errors import MaxDepthExceededError
+from wbn.object import Documents
+from wbn.sample.datasets import load_pr_newswire
+
+
+def split(documents: Documents) -> Tuple[Documents, Documents]:
+    """Deterministic train/test split holding out every fifth document."""
+    train = Documents([doc for idx, doc in enumerate(documents) if idx % 5])
+    test = Documents([doc for idx, doc in enumerate(documents) if not idx % 5])
+
+    return train, test
+
+
+def run(combination_sizes: List[int], depths: List[float]) -> None:
+    """Fits and evaluates WBN for each combination size and depth."""
+    train, test = split(load_pr_newswire())
+
+    print("size  depth  fit (s)  predict/doc (ms)  accuracy  exceeded")
+    for size, depth in itertools.product(combination_sizes, depths):
+        wbn = WBN(depth=depth, combination_size=size)
+
+        start = time.perf_counter()
+        wbn.fit(train.data, train.target)
+        fit_time = time.perf_counter() - start
+
+        correct, exceeded = 0, 0
+        start = time.perf_counter()
+        for entry in test.documents:
+            try:
+                (pred,) = wbn.reverse_encode(wbn.predict([entry.data]))
+            except MaxDepthExceededError:
+                exceeded += 1
+                continue
+            correct += pred == entry.target
+        predict_time = (time.perf_counter() - start) / len(test) * 1000
+
+        print(
+            "{:>4}  {:>5}  {:>7.3f}  {:>16.2f}  {:>8.3f}  {:>8}".format(
+                size,
+                depth,
+                fit_time,
+                predict_time,
+                correct / len(test),
+                exceeded,
+            )
+        )
+
+
+if __name__ == "__main__":
+    run([2, 3, 4], [0.05, 0.25, 0.75])
@@ -0,0 +1,103 @@
+"""Benchmark of predict latency under steady load across a model swap."""
+import pickle
+import random
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from wbn.classifier import WBN
+from wbn.handle import ModelHandle
+from wbn.sample.datasets import load_pr_newswire
+
+
+def client(
+    handle: ModelHandle,
+    documents: list,
+    stop: threading.Event,
+    samples: List[Tuple[float, float, int]],
+) -> None:
+    """Predicts random documents until 'stop', recording latencies."""
+    rng = random.Random(0)
+    while not stop.is_set():
+        entry = rng.choice(documents)
+        start = time.perf_counter()
+        result = handle.predict([entry])
+        samples.append(
+            (start, time.perf_counter() - start, result.version)
+        )
+
+
+def summarize(name: str, latencies: List[float]) -> None:
+    """Prints latency percentiles in milliseconds."""
+    millis = np.array(latencies) * 1000
+    print(
+        "{:<8} n={:<6} p50={:>6.2f}ms p99={:>6.2f}ms max={:>6.2f}ms".format(
+            name,
+            len(millis),
+            np.percentile(millis, 50),
+            np.percentile(millis, 99),
+            millis.max(),
+        )
+    )
+
+
+def run(
+    clients: int = 4, seconds: float = 3.0, swap: Optional[float] = None
+) -> float:
+    """Swaps a freshly loaded model in halfway through a steady load.
+
+    With 'swap' given no model is loaded, instead the same window of that
+    many seconds is summarized as a control for the latency noise.
+    """
+    sample = load_pr_newswire()
+    model = WBN(cache_size=1024)
+    model.fit(sample.data, sample.target)
+    payload = pickle.dumps(model)
+
+    handle = ModelHandle(model)
+    stop = threading.Event()
+    samples: List[Tuple[float, float, int]] = list()
+    threads = [
+        threading.Thread(
+            target=client, args=(handle, sample.data, stop, samples)
+        )
+        for _ in range(clients)
+    ]
+    for thread in threads:
+        thread.start()
+
+    time.sleep(seconds / 2)
+    load_start = time.perf_counter()
+    if swap is None:
+        handle.load(lambda: pickle.loads(payload)).result()
+    else:
+        time.sleep(swap)
+    load_end = time.perf_counter()
+    time.sleep(seconds / 2)
+
+    stop.set()
+    for thread in threads:
+        thread.join()
+    handle.close()
+
+    summarize("before", [lat for ts, lat, _ in samples if ts < load_start])
+    summarize(
+        "during",
+        [lat for ts, lat, _ in samples if load_start <= ts <= load_end],
+    )
+    summarize("after", [lat for ts, lat, _ in samples if ts > load_end])
+    print(
+        "{} took {:.1f}ms, versions served: {}".format(
+            "swap" if swap is None else "control",
+            (load_end - load_start) * 1000,
+            sorted(set(version for _, _, version in samples)),
+        )
+    )
+
+    return load_end - load_start
+
+
+if __name__ == "__main__":
+    run(swap=run())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+"""Tests for `wbn.accumulator` package."""
+from unittest import TestCase
+
+from wbn.accumulator import SpillingAccumulator
+from wbn.config import SPILL_FAN_IN
+
+
+class TestSpillingAccumulator(TestCase):
+    """Unit test suite for SpillingAccumulator."""
+
+    def setUp(self) -> None:
+        self.test_accumulator = SpillingAccumulator(memory_budget=0)
+
+    def tearDown(self) -> None:
+        self.test_accumulator.close()
+
+    def test_spill(self):
+        """Unit test for 'add(...)' spilling over budget."""
+        self.test_accumulator.add("foo", {"hello": 2})
+        self.test_accumulator.add("foo", {"world": 1})
+
+        assert len(self.test_accumulator.spills) == 2
+        assert self.test_accumulator.documents["foo"] == 2
+
+    def test_merge(self):
+        """Unit test for 'merge(...)' of spilled and in-memory counts."""
+        self.test_accumulator.add("foo", {"hello": 2, "world": 1})
+        self.test_accumulator.add("bar", {"hello": 1})
+        self.test_accumulator.memory_budget = 1024
+        self.test_accumulator.add("foo", {"hello": 3})
+
+        assert list(self.test_accumulator.merge()) == [
+            ("bar", "hello", 1, 1),
+            ("foo", "hello", 5, 2),
+            ("foo", "world", 1, 1),
+        ]
+
+    def test_tiers(self):
+        """Unit test for tiered compaction of spilled runs."""
+        for idx in range(SPILL_FAN_IN ** 2 - 1):
+            self.test_accumulator.add("foo", {"word{:02d}".format(idx): 1})
+
+        # Full tiers are compacted, the last of each tier is not yet full
+        tiers = [1] * (SPILL_FAN_IN - 1) + [0] * (SPILL_FAN_IN - 1)
+        assert self.test_accumulator._tiers == tiers
+
+        self.test_accumulator.add("foo", {"word99": 1})
+        assert self.test_accumulator._tiers == [2]
+
+    def test_merge_fan_in(self):
+        """Unit test for 'merge(...)' of more runs than 'SPILL_FAN_IN'."""
+        for idx in range(SPILL_FAN_IN ** 2 - 1):
+            self.test_accumulator.add("foo", {"hello": 1, str(idx % 3): 2})
+        result = list(self.test_accumulator.merge())
+
+        assert len(self.test_accumulator.spills) <= SPILL_FAN_IN
+        assert result == [
+            ("foo", "0", 42, 21),
+            ("foo", "1", 42, 21),
+            ("foo", "2", 42, 21),
+            ("foo", "hello", 63, 63),
+        ]
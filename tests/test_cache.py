@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+
+"""Tests for `wbn.cache` package."""
+import pickle
+from unittest import TestCase
+
+from wbn.cache import LRUCache
+from wbn.object import CacheInfo
+
+
+class TestLRUCache(TestCase):
+    """Unit test suite for LRUCache."""
+
+    def setUp(self) -> None:
+        self.test_cache = LRUCache(maxsize=2)
+
+    def test_eviction(self):
+        """Unit test for least recently used eviction."""
+        self.test_cache.put("foo", 1)
+        self.test_cache.put("bar", 2)
+        self.test_cache.get("foo")
+        self.test_cache.put("baz", 3)
+
+        assert self.test_cache.get("bar") is None
+        assert self.test_cache.get("foo") == 1
+        assert self.test_cache.info() == CacheInfo(2, 1, 1, 2, 2)
+
+    def test_disabled(self):
+        """Unit test for a zero sized cache."""
+        test_cache = LRUCache(maxsize=0)
+        test_cache.put("foo", 1)
+
+        assert test_cache.get("foo") is None
+        assert test_cache.info() == CacheInfo(0, 0, 0, 0, 0)
+
+    def test_pickle(self):
+        """Unit test for reloaded caches starting cold."""
+        self.test_cache.put("foo", 1)
+        result = pickle.loads(pickle.dumps(self.test_cache))
+
+        assert len(result) == 0
+        assert result.maxsize == 2
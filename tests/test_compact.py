@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Tests for `wbn.compact` package."""
+import pickle
+from unittest import TestCase
+
+import numpy as np
+
+from wbn.cache import LRUCache
+from wbn.classifier import WBN
+from wbn.compact import CompactModel, compare
+from wbn.sample.datasets import load_pr_newswire
+
+
+class TestCompactModel(TestCase):
+    """Unit test suite for CompactModel."""
+
+    def setUp(self) -> None:
+        self.sample = load_pr_newswire()
+        self.test_wbn = WBN()
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+
+    def test_predict(self):
+        """Unit test for 'predict(...)' against the full model."""
+        result = CompactModel.from_model(self.test_wbn, precision="float64")
+
+        assert result.predict(self.sample.data[:10]) == self.test_wbn.predict(
+            self.sample.data[:10]
+        )
+
+    def test_quantized(self):
+        """Unit test for quantized node records."""
+        result = CompactModel.from_model(self.test_wbn, precision="uint8")
+        (classification, *_) = result.classes
+
+        assert classification.factors.dtype == np.uint8
+        assert classification.words.dtype == np.uint8  # 201 words
+        assert len(result.predict(self.sample.data[:2])) == 2
+
+    def test_pickle(self):
+        """Unit test for pickling to worker processes."""
+        compact = CompactModel.from_model(self.test_wbn)
+        result = pickle.loads(pickle.dumps(compact))
+
+        assert result.predict(self.sample.data[:2]) == compact.predict(
+            self.sample.data[:2]
+        )
+
+    def test_compare(self):
+        """Unit test for 'compare(...)' report."""
+        self.test_wbn.cache = LRUCache(maxsize=16)
+        result = compare(
+            self.test_wbn,
+            data=self.sample.data[:10],
+            target=self.sample.target[:10],
+            precisions=["float32", "uint8"],
+        )
+
+        assert [report.precision for report in result] == ["float32", "uint8"]
+        assert all(report.ratio > 5 for report in result)
+        assert result[0].agreement == 1.0
+        assert self.test_wbn.predictions == []
+        assert self.test_wbn.cache.info() == LRUCache(maxsize=16).info()
@@ -7,7 +7,15 @@ import pytest
 
 from tests.data.sample import SAMPLE_DATASET
 from wbn.classifier import WBN
-from wbn.errors import InstanceCountError
+from wbn.errors import (
+    CombinationSizeError,
+    FoldCountError,
+    InstanceCountError,
+    MemoryLimitExceededError,
+    ModelCountError,
+    RankCountError,
+    WarmShareError,
+)
 
 
 class TestInstanceCountError(TestCase):
@@ -33,3 +41,80 @@ class TestInstanceCountError(TestCase):
             exception.__str__()
             == "Number of instances: 2 does not match number of targets: 1"
         )
+
+
+class TestFoldCountError(TestCase):
+    """Unit test suite for FoldCountError."""
+
+    def test_str(self):
+        """Unit test for '__str__()' of FoldCountError."""
+        exception = FoldCountError(3, 2)
+
+        assert exception.__str__() == (
+            "Number of folds: 3 must be between 2 and number of instances: 2"
+        )
+
+
+class TestMemoryLimitExceededError(TestCase):
+    """Unit test suite for MemoryLimitExceededError."""
+
+    def test_str(self):
+        """Unit test for '__str__()' of MemoryLimitExceededError."""
+        exception = MemoryLimitExceededError(2048, 1024)
+
+        assert exception.__str__() == (
+            "Estimated model size of 2048 bytes exceeds memory limit of "
+            "1024 bytes"
+        )
+
+
+class TestModelCountError(TestCase):
+    """Unit test suite for ModelCountError."""
+
+    def test_str(self):
+        """Unit test for '__str__()' of ModelCountError."""
+        exception = ModelCountError(0)
+
+        assert (
+            exception.__str__()
+            == "Number of models: 0 must be at least 1 to merge"
+        )
+
+
+class TestCombinationSizeError(TestCase):
+    """Unit test suite for CombinationSizeError."""
+
+    def test_str(self):
+        """Unit test for '__str__()' of CombinationSizeError."""
+        exception = CombinationSizeError(0)
+
+        assert exception.__str__() == "Combination size: 0 must be at least 1"
+
+    def test_raises(self):
+        """Unit test for CombinationSizeError raises."""
+        with pytest.raises(CombinationSizeError):
+            WBN(combination_size=0)
+
+
+class TestWarmShareError(TestCase):
+    """Unit test suite for WarmShareError."""
+
+    def test_str(self):
+        """Unit test for '__str__()' of WarmShareError."""
+        exception = WarmShareError(0)
+
+        assert exception.__str__() == (
+            "Warm share: 0 must be greater than 0 and at most 1"
+        )
+
+
+class TestRankCountError(TestCase):
+    """Unit test suite for RankCountError."""
+
+    def test_str(self):
+        """Unit test for '__str__()' of RankCountError."""
+        exception = RankCountError(0)
+
+        assert exception.__str__() == (
+            "Number of ranked classes: 0 must be at least 1"
+        )
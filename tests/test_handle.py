@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+"""Tests for `wbn.handle` package."""
+from unittest import TestCase
+
+import pytest
+
+from wbn.classifier import WBN
+from wbn.errors import WarmShareError
+from wbn.handle import ModelHandle
+from wbn.sample.datasets import load_pr_newswire
+
+
+class TestModelHandle(TestCase):
+    """Unit test suite for ModelHandle."""
+
+    def setUp(self) -> None:
+        self.sample = load_pr_newswire()
+        test_wbn = WBN(cache_size=16)
+        test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        self.test_handle = ModelHandle(test_wbn)
+
+    def _loader(self) -> WBN:
+        test_wbn = WBN(cache_size=16)
+        test_wbn.fit(data=self.sample.data, target=self.sample.target)
+
+        return test_wbn
+
+    def test_predict(self):
+        """Unit test for 'predict(...)'."""
+        result = self.test_handle.predict(self.sample.data[:2])
+
+        assert result.version == 1
+        assert result.labels == self.sample.target[:2]
+
+    def test_load(self):
+        """Unit test for 'load(...)' swapping and warming in background."""
+        expected = self.test_handle.predict(self.sample.data[:4])
+        version = self.test_handle.load(self._loader).result()
+        result = self.test_handle.predict(self.sample.data[:4])
+
+        assert version == 2
+        assert result.version == 2
+        assert result.predictions == expected.predictions
+        assert self.test_handle.model.cache.info().hits == 4
+        assert len(self.test_handle.model.predictions) == 4
+
+    def test_load_uncached(self):
+        """Unit test for 'load(...)' sizing warm-up from the current cache."""
+        test_handle = ModelHandle(self._loader(), history=16)
+        test_handle.model.cache.clear()
+        test_handle.model.cache.maxsize = 0
+        test_handle.predict(self.sample.data[:4])
+        test_handle.load(self._loader).result()
+        test_handle.predict(self.sample.data[:4])
+
+        assert test_handle.model.cache.info().hits == 0
+        assert test_handle.model.cache.info().misses == 4
+
+    def test_close(self):
+        """Unit test for 'close()' shutting down background loading."""
+        self.test_handle.load(self._loader)
+        self.test_handle.close()
+
+        assert self.test_handle.version == 2
+        with pytest.raises(RuntimeError):
+            self.test_handle.load(self._loader)
+
+    def test_warm_share(self):
+        """Unit test for WarmShareError raises."""
+        for warm_share in (0, -0.5, 1.5):
+            with pytest.raises(WarmShareError):
+                ModelHandle(self.test_handle.model, warm_share=warm_share)
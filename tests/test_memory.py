@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+
+"""Tests for `wbn.memory` package."""
+from unittest import TestCase
+
+import pytest
+
+from wbn import memory
+from wbn.classifier import WBN
+from wbn.errors import MemoryLimitExceededError
+from wbn.sample.datasets import load_pr_newswire
+
+
+class TestMemory(TestCase):
+    """Unit test suite for memory accounting."""
+
+    def setUp(self) -> None:
+        self.sample = load_pr_newswire()
+        self.test_wbn = WBN()
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+
+    def test_report(self):
+        """Unit test for 'memory_report(...)'."""
+        result = self.test_wbn.memory_report()
+
+        assert set(result.classes) == set(self.test_wbn.targets)
+        assert result.total == sum(
+            sum(sizes.values()) for sizes in result.classes.values()
+        ) + sum(result[1:5])
+
+        self.test_wbn.predict(self.sample.data[:5])
+        assert self.test_wbn.memory_report().predictions > result.predictions
+
+    def test_estimate(self):
+        """Unit test for 'estimate(...)' against the measured model."""
+        report = self.test_wbn.memory_report()
+        measured = report.total - report.predictions - report.cache
+        result = memory.estimate(self.test_wbn.statistics.words)
+
+        assert 0.8 * measured < result < 1.25 * measured
+
+    def test_memory_limit(self):
+        """Unit test for fitting over and near 'memory_limit'."""
+        with pytest.raises(MemoryLimitExceededError):
+            WBN(memory_limit=1024).fit(
+                data=self.sample.data, target=self.sample.target
+            )
+
+        estimate = memory.estimate(self.test_wbn.statistics.words)
+        with self.assertLogs("wbn.classifier", level="WARNING"):
+            WBN(memory_limit=estimate + 1).fit(
+                data=self.sample.data, target=self.sample.target
+            )
@@ -31,7 +31,7 @@ class TestClassification(TestCase):
 
     def setUp(self) -> None:
         self.test_classification = Classification(
-            nx.DiGraph(), "foo-bar", ["hello", "world"]
+            nx.DiGraph(), "foo-bar", ["hello", "world"], dict()
         )
 
     def test_values(self):
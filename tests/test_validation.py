@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""Tests for `wbn.validation` package."""
+from unittest import TestCase
+
+import pytest
+
+from tests.data.sample import SAMPLE_DATASET
+from wbn.classifier import WBN
+from wbn.errors import FoldCountError
+from wbn.sample.datasets import load_pr_newswire
+from wbn.validation import cross_validate
+
+
+class TestCrossValidate(TestCase):
+    """Unit test suite for cross_validate."""
+
+    def setUp(self) -> None:
+        sample = load_pr_newswire()
+        self.data = sample.data[:60]
+        self.target = sample.target[:60]
+
+    def test_matches_independent_fits(self):
+        """Unit test for fold predictions against independent fits."""
+        result = cross_validate(data=self.data, target=self.target, k=3)
+
+        assert len(result) == 3
+        assert sorted(sum([fold.indices for fold in result], [])) == list(
+            range(60)
+        )
+        for fold in result:
+            train = [
+                idx for idx in range(len(self.data)) if idx not in fold.indices
+            ]
+            test_wbn = WBN()
+            test_wbn.fit(
+                data=[self.data[idx] for idx in train],
+                target=[self.target[idx] for idx in train],
+            )
+            expected = test_wbn.reverse_encode(
+                test_wbn.predict([self.data[idx] for idx in fold.indices])
+            )
+
+            assert fold.predictions == expected
+
+    def test_combination_size(self):
+        """Unit test for fold models of a 'combination_size'."""
+        result = cross_validate(
+            data=self.data, target=self.target, k=3, combination_size=3
+        )
+        (fold, *_) = result
+        train = [
+            idx for idx in range(len(self.data)) if idx not in fold.indices
+        ]
+        test_wbn = WBN(combination_size=3)
+        test_wbn.fit(
+            data=[self.data[idx] for idx in train],
+            target=[self.target[idx] for idx in train],
+        )
+
+        assert fold.predictions == test_wbn.reverse_encode(
+            test_wbn.predict([self.data[idx] for idx in fold.indices])
+        )
+
+    def test_parallel(self):
+        """Unit test for folds run in worker processes."""
+        result = cross_validate(
+            data=self.data[:20], target=self.target[:20], k=2, n_jobs=2
+        )
+
+        assert [len(fold.predictions) for fold in result] == [10, 10]
+
+    def test_max_depth_exceeded(self):
+        """Unit test for held-out instances exceeding 'depth'."""
+        result = cross_validate(
+            data=self.data[:20], target=self.target[:20], k=2, depth=100.0
+        )
+
+        assert [fold.predictions for fold in result] == [[None] * 10] * 2
+
+    def test_raises(self):
+        """Unit test for FoldCountError raises."""
+        with pytest.raises(FoldCountError):
+            cross_validate(
+                data=SAMPLE_DATASET.data, target=SAMPLE_DATASET.target, k=3
+            )
@@ -1,14 +1,26 @@
 #!/usr/bin/env python
 
 """Tests for `wbn` package."""
+import itertools
+import json
+import random
+import tracemalloc
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from unittest import TestCase
 
+import numpy as np
 import pytest
 
 from tests.data.sample import SAMPLE_DATASET
 from wbn.classifier import WBN
-from wbn.errors import InstanceCountError, MaxDepthExceededError
+from wbn.errors import (
+    InstanceCountError,
+    MaxDepthExceededError,
+    ModelCountError,
+    RankCountError,
+)
+from wbn.object import Document, DocumentData, Documents, Statistics
 from wbn.sample.datasets import load_pr_newswire
 
 
@@ -27,10 +39,206 @@ class TestWBN(TestCase):
 
         assert len(result) == 5
 
+    def test_refit(self):
+        """Unit test for 'fit(...)' replacing a previously fit model."""
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        shard = Documents(self.sample[::2])
+        result = self.test_wbn.fit(data=shard.data, target=shard.target)
+        expected = WBN()
+        expected.fit(data=shard.data, target=shard.target)
+
+        assert len(result) == len(expected.classes) == 5
+        assert self.test_wbn.statistics == expected.statistics
+        assert self.test_wbn.targets == expected.targets
+        assert self.test_wbn.corpus == expected.corpus
+        assert self.test_wbn.predict(
+            self.sample.data[:10]
+        ) == expected.predict(self.sample.data[:10])
+
+    def test_fit_stream(self):
+        """Unit test for 'fit_stream(...)'."""
+        chunks = [self.sample[idx:idx + 50] for idx in range(0, 184, 50)]
+        test_wbn = WBN()
+        result = test_wbn.fit_stream(chunks=chunks, memory_budget=4096)
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+
+        assert len(result) == 5
+        assert test_wbn.reverse_encode(
+            test_wbn.predict(self.sample.data[:10])
+        ) == self.test_wbn.reverse_encode(
+            self.test_wbn.predict(self.sample.data[:10])
+        )
+
+    def test_fit_stream_empty_class(self):
+        """Unit test for 'fit_stream(...)' of a class without keywords."""
+        documents = Documents(
+            list(self.sample)
+            + [Document(DocumentData(["foo"], []), "aaa")]
+            + [Document(DocumentData(["foo"], []), "zzz")]
+        )
+        test_wbn = WBN()
+        result = test_wbn.fit_stream(chunks=[documents], memory_budget=4096)
+        self.test_wbn.fit(data=documents.data, target=documents.target)
+
+        assert len(result) == len(self.test_wbn.classes) == 7
+        assert test_wbn.statistics == self.test_wbn.statistics
+        assert test_wbn.targets == self.test_wbn.targets
+
+    def test_fit_stream_memory(self):
+        """Unit test for 'fit_stream(...)' peak memory following budget."""
+        rng = random.Random(0)
+        documents = Documents(
+            [
+                Document(
+                    DocumentData(
+                        [],
+                        [str(rng.randrange(20000)) for _ in range(40)],
+                    ),
+                    "c{}".format(idx % 3),
+                )
+                for idx in range(400)
+            ]
+        )
+        chunks = [documents[idx:idx + 100] for idx in range(0, 400, 100)]
+
+        transient = dict()
+        for budget in [128 * 1024, 10 ** 9]:
+            test_wbn = WBN()
+            tracemalloc.start()
+            test_wbn.fit_stream(chunks=chunks, memory_budget=budget)
+            retained, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            transient[budget] = peak - retained
+
+        # Slack covers stemming of a single chunk
+        assert transient[128 * 1024] < 128 * 1024 + 1024 ** 2
+        assert transient[10 ** 9] > 2 * transient[128 * 1024]
+
     def test_predict(self):
         """Unit test for 'predict(...)'."""
         assert 2 == 2
 
+    def test_predict_multi_depth(self):
+        """Unit test for 'predict_multi_depth(...)'."""
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        depths = [0.01, 0.05, 100.0]
+        result = self.test_wbn.predict_multi_depth(
+            data=self.sample.data[:10], depths=depths
+        )
+
+        assert result.shape == (10, 3)
+        assert result.mask[:, 2].all()
+        for col, depth in enumerate(depths[:2]):
+            self.test_wbn.depth = depth
+            assert result[:, col].tolist() == self.test_wbn.predict(
+                self.sample.data[:10]
+            )
+
+    def test_predict_combination_size(self):
+        """Unit test for 'predict(...)' with higher order combinations."""
+        test_wbn = WBN(combination_size=3)
+        result = test_wbn.fit(data=self.sample.data, target=self.sample.target)
+
+        assert all(
+            fit_class.dag.number_of_edges() == 0 for fit_class in result
+        )
+        assert len(test_wbn.predict(self.sample.data[:5])) == 5
+        assert all(len(pred.edges[0]) == 4 for pred in test_wbn.predictions)
+
+    def test_combine(self):
+        """Unit test for '_combine(...)' best-first enumeration."""
+        factors = [0.5, 1.5, 0.25, 1.5, 2.0, 0.75, 1.0, 0.125]
+        nodes = [(factor, idx) for idx, factor in enumerate(factors)]
+        for combination_size in [1, 2, 3, 4]:
+            expected = sorted(
+                (
+                    np.prod([factors[idx] for idx in combination])
+                    for combination in itertools.combinations(
+                        range(len(factors)), combination_size
+                    )
+                ),
+                reverse=True,
+            )
+            expected = expected[:12]
+            cumulative, edges = WBN._combine(nodes, 12, combination_size)
+
+            assert len(edges) == len(expected)
+            assert np.allclose([edge[-1] - 1 for edge in edges], expected)
+            assert np.allclose(cumulative, np.cumprod(expected))
+            assert all(list(edge[:-1]) == sorted(edge[:-1]) for edge in edges)
+
+    def test_predict_cache(self):
+        """Unit test for 'predict(...)' with a prediction cache."""
+        test_wbn = WBN(cache_size=4)
+        test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        expected = test_wbn.predict(self.sample.data[:3])
+        resent = [
+            DocumentData(entry.tokens + entry.tokens[:5], entry.keywords)
+            for entry in self.sample.data[:3]
+        ]
+
+        assert test_wbn.predict(resent) == expected
+        assert test_wbn.cache.info().hits == 3
+        assert test_wbn.predictions[3:] == test_wbn.predictions[:3]
+
+        test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        assert len(test_wbn.cache) == 0
+
+    def test_predict_scores(self):
+        """Unit test for 'predict_scores(...)'."""
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        result = self.test_wbn.predict_scores(self.sample.data[:10])
+
+        assert result.shape == (10, 5)
+        assert result.argmax(axis=1).tolist() == self.test_wbn.predict(
+            self.sample.data[:10]
+        )
+
+        self.test_wbn.depth = 100.0
+        assert self.test_wbn.predict_scores(self.sample.data[:2]).mask.all()
+
+    def test_predict_top_n(self):
+        """Unit test for 'predict_top_n(...)'."""
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        result = self.test_wbn.predict_top_n(self.sample.data[:10], n=2)
+
+        assert result.indices.shape == result.scores.shape == (10, 2)
+        assert result.indices[:, 0].tolist() == self.test_wbn.predict(
+            self.sample.data[:10]
+        )
+        assert (result.scores[:, 0] >= result.scores[:, 1]).all()
+
+        with pytest.raises(RankCountError):
+            self.test_wbn.predict_top_n(self.sample.data[:10], n=-1)
+
+    def test_zero_depth(self):
+        """Unit test for a 'depth' rounding to no edges."""
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        result = self.test_wbn.predict_multi_depth(
+            data=self.sample.data[:5], depths=[0.0, 0.001, 0.05]
+        )
+
+        assert result.mask[:, :2].all()
+        assert not result.mask[:, 2].any()
+
+        self.test_wbn.depth = 0.001
+        with pytest.raises(MaxDepthExceededError):
+            self.test_wbn.predict(self.sample.data[:5])
+
+    def test_negative_depth(self):
+        """Unit test for a negative 'depth'."""
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+        result = self.test_wbn.predict_multi_depth(
+            data=self.sample.data[:5], depths=[-0.01, 0.05]
+        )
+
+        assert result.mask[:, 0].all()
+        assert not result.mask[:, 1].any()
+
+        self.test_wbn.depth = -0.01
+        with pytest.raises(MaxDepthExceededError):
+            self.test_wbn.predict(self.sample.data[:5])
+
     def test_reverse_encode(self):
         """Unit test for 'reverse_encode(...)'."""
         reverse = self.test_wbn.reverse_encode([0, 1])
@@ -64,3 +272,52 @@ class TestWBN(TestCase):
             self.test_wbn.fit(
                 data=SAMPLE_DATASET.data, target=SAMPLE_DATASET.target[:1]
             )
+
+
+def _fit_shard(shard):
+    """Fits a model on a shard of documents in a worker process."""
+    test_wbn = WBN()
+    test_wbn.fit(data=shard.data, target=shard.target)
+
+    return test_wbn
+
+
+class TestWBNMerge(TestCase):
+    """Unit test suite for WBN statistics merging."""
+
+    def setUp(self) -> None:
+        self.sample = load_pr_newswire()
+        self.test_wbn = WBN()
+        self.test_wbn.fit(data=self.sample.data, target=self.sample.target)
+
+    def test_merge(self):
+        """Unit test for 'merge(...)' of shards fit in processes."""
+        shards = [Documents(self.sample[idx::3]) for idx in range(3)]
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            models = list(executor.map(_fit_shard, shards))
+        result = WBN.merge(*models)
+
+        assert result.statistics == self.test_wbn.statistics
+        assert result.targets == self.test_wbn.targets
+        for merged, fit_class in zip(result.classes, self.test_wbn.classes):
+            assert list(merged.dag.nodes) == list(fit_class.dag.nodes)
+        assert result.predict(self.sample.data[:10]) == self.test_wbn.predict(
+            self.sample.data[:10]
+        )
+
+    def test_merge_empty(self):
+        """Unit test for 'merge(...)' of no models."""
+        with pytest.raises(ModelCountError):
+            WBN.merge()
+
+    def test_from_statistics(self):
+        """Unit test for 'from_statistics(...)' of serialized statistics."""
+        serialized = json.loads(json.dumps(self.test_wbn.statistics))
+        result = WBN.from_statistics(Statistics(*serialized))
+
+        assert json.dumps(result.statistics, sort_keys=True) == json.dumps(
+            self.test_wbn.statistics, sort_keys=True
+        )
+        assert result.predict(self.sample.data[:10]) == self.test_wbn.predict(
+            self.sample.data[:10]
+        )
@@ -0,0 +1,176 @@
+"""Bounded Memory Accumulator for WBN."""
+import heapq
+import io
+import json
+import tempfile
+from collections import Counter
+from operator import itemgetter
+from typing import (
+    IO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from wbn.config import MEMORY_BUDGET, SPILL_ENTRY_BYTES, SPILL_FAN_IN
+
+
+class SpillingAccumulator(object):
+    """Accumulates (count, positive) word statistics by classification,
+    spilling sorted partial counts to local disk when over budget.
+
+    Spilled runs are compacted in tiers: once 'SPILL_FAN_IN' runs of one
+    tier exist they are merged into a single run of the next tier, so each
+    entry is rewritten once per tier and open runs grow logarithmically.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int = MEMORY_BUDGET,
+        directory: Optional[str] = None,
+    ):
+        self.memory_budget = memory_budget
+        self.directory = directory
+        self.documents: Counter = Counter()
+        self.spills: List[IO[str]] = list()
+        self._tiers: List[int] = list()  # Compaction tier of each spill
+        self._counts: Dict[Tuple[str, str], List[int]] = dict()
+        self._size = 0
+
+        # Run buffers share the budget with in-memory counts
+        self._buffering = min(
+            max(memory_budget // (SPILL_FAN_IN + 1), 512),
+            io.DEFAULT_BUFFER_SIZE,
+        )
+
+    def add(self, cls: str, counts: Dict[str, int]) -> None:
+        """Adds stemmed keyword counts of a single instance.
+
+        Parameters
+        ----------
+        cls : str
+            Target classification of instance
+
+        counts : Dict[str, int]
+            Stemmed keyword counts of instance
+
+        """
+        self.documents[cls] += 1
+        for word, count in counts.items():
+            entry = self._counts.get((cls, word))
+            if entry is None:
+                self._counts[(cls, word)] = [count, 1]
+                self._size += SPILL_ENTRY_BYTES + len(cls) + len(word)
+            else:
+                entry[0] += count
+                entry[1] += 1
+
+        if self._size > self.memory_budget:
+            self.spill()
+
+    def spill(self) -> None:
+        """Writes in-memory counts to disk sorted by (class, word)."""
+        if not self._counts:
+            return
+
+        self.spills.append(self._write(self._sorted()))
+        self._tiers.append(0)
+        self._counts = dict()
+        self._size = 0
+
+        # Tiers never increase towards the tail, so a full tier is a tail
+        tail = self._tiers[-SPILL_FAN_IN:]
+        while len(tail) == SPILL_FAN_IN and len(set(tail)) == 1:
+            self._compact(SPILL_FAN_IN)
+            tail = self._tiers[-SPILL_FAN_IN:]
+
+    def merge(self) -> Iterator[Tuple[str, str, int, int]]:
+        """Merges spilled and in-memory counts.
+
+        Returns
+        -------
+        Iterator[Tuple[str, str, int, int]]
+            Class, word, count and positive sorted by (class, word)
+
+        """
+        while len(self.spills) > SPILL_FAN_IN:
+            # Bounded fan-in, the smallest runs are at the tail
+            self._compact(SPILL_FAN_IN)
+
+        for entry in self._combine(
+            [self._sorted()] + self._read(self.spills)  # type: ignore
+        ):
+            yield tuple(entry)  # type: ignore
+
+    def close(self) -> None:
+        """Removes spilled partial counts from disk."""
+        for spill in self.spills:
+            spill.close()
+
+        self.spills = list()
+        self._tiers = list()
+
+    def _compact(self, count: int) -> None:
+        """Merges the last 'count' spilled runs into one run of the next
+        tier.
+
+        Parameters
+        ----------
+        count : int
+            Number of spilled runs to merge
+
+        """
+        runs = self.spills[-count:]
+        tier = self._tiers[-count] + 1
+        merged = self._write(self._combine(self._read(runs)))
+        for run in runs:
+            run.close()
+
+        self.spills[-count:] = [merged]
+        self._tiers[-count:] = [tier]
+
+    def _sorted(self) -> List[list]:
+        """In-memory counts as [class, word, count, positive] entries
+        sorted by (class, word)."""
+        return sorted(
+            [cls, word, count, positive]
+            for (cls, word), (count, positive) in self._counts.items()
+        )
+
+    def _write(self, entries: Iterable[list]) -> IO[str]:
+        """Writes sorted entries to a new run rewound for reading."""
+        run = tempfile.TemporaryFile(
+            mode="w+", buffering=self._buffering, dir=self.directory
+        )
+        for entry in entries:
+            run.write(json.dumps(entry) + "\n")
+        run.seek(0)
+
+        return run
+
+    @staticmethod
+    def _read(runs: List[IO[str]]) -> List[Iterator[list]]:
+        """Lazily parses entries of each run."""
+        return [map(json.loads, run) for run in runs]
+
+    @staticmethod
+    def _combine(partials: Sequence[Iterable[list]]) -> Iterator[list]:
+        """Merges sorted partial counts, summing entries of equal
+        (class, word)."""
+        current: Optional[list] = None
+        for entry in heapq.merge(*partials, key=itemgetter(0, 1)):
+            if current is not None and current[:2] == entry[:2]:
+                current[2] += entry[2]
+                current[3] += entry[3]
+                continue
+
+            if current is not None:
+                yield current
+            current = entry
+
+        if current is not None:
+            yield current
@@ -0,0 +1,89 @@
+"""Prediction Cache for WBN."""
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from wbn.object import CacheInfo
+
+
+class LRUCache(object):
+    """Bounded least recently used cache with hit/miss/eviction counters."""
+
+    def __init__(self, maxsize: int = 0):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Entries and lock are not carried over, reloads start cold
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(maxsize=state["maxsize"])  # type: ignore
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Looks up 'key', marking it as most recently used.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key
+
+        Returns
+        -------
+        Optional[Any]
+            Cached value or None if missing or disabled
+
+        """
+        if not self.maxsize:
+            return None
+
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores 'value' under 'key', evicting the least recently used
+        entry when full.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key
+
+        value : Any
+            Value to be cached
+
+        """
+        if not self.maxsize:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Removes all entries, keeping counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> CacheInfo:
+        """Snapshot of cache counters."""
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, len(self), self.maxsize
+        )
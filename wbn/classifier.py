@@ -1,21 +1,46 @@
 """Weighted Bayesian Network Text Classification Model."""
+import heapq
 import itertools
 import logging
 from collections import Counter, defaultdict
-from operator import itemgetter
-from typing import Any, DefaultDict, Dict, List, Tuple
+from functools import reduce
+from operator import itemgetter, mul
+from typing import (
+    Any,
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import networkx as nx
 import numpy as np
 from nltk import PorterStemmer
 
-from wbn.config import COMBINATION_SIZE
-from wbn.errors import InstanceCountError, MaxDepthExceededError
+from wbn.accumulator import SpillingAccumulator
+from wbn.cache import LRUCache
+from wbn import memory
+from wbn.config import COMBINATION_SIZE, MEMORY_BUDGET, MEMORY_WARNING_RATIO
+from wbn.errors import (
+    CombinationSizeError,
+    InstanceCountError,
+    MaxDepthExceededError,
+    MemoryLimitExceededError,
+    ModelCountError,
+    RankCountError,
+)
 from wbn.object import (
     Attribute,
     Classification,
     ClassificationScore,
+    Document,
     DocumentData,
+    MemoryReport,
+    RankedPredictions,
+    Statistics,
 )
 
 logging.basicConfig(level="INFO")
@@ -25,13 +50,26 @@ _LOGGER = logging.getLogger(__name__)
 class WBN(object):
     """Weighted Bayesian Network Classifier."""
 
-    def __init__(self, depth: float = 0.05):
+    def __init__(
+        self,
+        depth: float = 0.05,
+        combination_size: int = COMBINATION_SIZE,
+        cache_size: int = 0,
+        memory_limit: Optional[int] = None,
+    ):
+        if combination_size < 1:
+            raise CombinationSizeError(combination_size)
+
         self.depth = depth
+        self.combination_size = combination_size
+        self.cache = LRUCache(maxsize=cache_size)
+        self.memory_limit = memory_limit
         self.classes = list()  # type: List[Classification]
         self.corpus = list()  # type: List[str]
         self.targets = dict()  # type: Dict[Any, int]
         self.predictions = list()  # type: List[ClassificationScore]
         self._reverse_encoded = dict()  # type: Dict[int, Any]
+        self.statistics = Statistics(documents=dict(), words=dict())
 
     def fit(
         self, data: List[DocumentData], target: List[str]
@@ -56,60 +94,185 @@ class WBN(object):
         # Failure to validate prevents model fitting
         self._validate(data, target)
 
-        self._encode(target=target)
-        stemmer = PorterStemmer()  # Instantiate stemmer
-        by_class = defaultdict(dict)  # type: DefaultDict
-        for idx, entry in enumerate(data):
-            # Establish universe for all targets
-            stemmed_entry = [stemmer.stem(word) for word in entry.keywords]
-            weighted = Counter(stemmed_entry)  # type: Dict[str, int]
+        by_class = self._aggregate(counts=self._count(data), target=target)
 
-            # Injects value for probability table
-            by_word = {k: (v, 1) for k, v in weighted.items()}
-            # Create a weighted dict for weighting
-            by_class[target[idx]] = self._update(
-                parent=by_class[target[idx]], child=by_word
-            )
+        return self._fit_statistics(
+            Statistics(documents=dict(Counter(target)), words=dict(by_class))
+        )
 
-        for cls, keywords in by_class.items():
-            total_words = sum([kw[0] for kw in keywords.values()])
-            cls_dag = nx.DiGraph()
-            matrix = list(
-                itertools.combinations(
-                    [
-                        Attribute(
-                            word=word,
-                            weight=count / total_words,
-                            positive=positive,
-                            negative=len(
-                                [
-                                    instance
-                                    for instance in target
-                                    if instance == cls
-                                ]
-                            )
-                            - positive,  # Total minus positive values
-                        )
-                        for word, (count, positive) in keywords.items()
-                    ],
-                    COMBINATION_SIZE,
-                )
+    def fit_stream(
+        self,
+        chunks: Iterable[List[Document]],
+        memory_budget: int = MEMORY_BUDGET,
+        directory: Optional[str] = None,
+    ) -> List[Classification]:
+        """Builds directed acyclic graphs and corpora from chunks of
+        documents too large to hold in memory at once.
+
+        Word counts are accumulated within 'memory_budget' bytes, spilling
+        sorted partial counts to 'directory' and merging them once all
+        chunks are consumed.
+
+        Parameters
+        ----------
+        chunks : Iterable[List[Document]]
+            Iterable of annotated keyword and target classification chunks
+
+        memory_budget : int
+            Estimated bytes of accumulated counts held before spilling
+
+        directory : Optional[str]
+            Directory of spilled partial counts, system default if None
+
+        Returns
+        -------
+        List[Classification]
+            Array of dag & corpus classifications
+
+        """
+        accumulator = SpillingAccumulator(
+            memory_budget=memory_budget, directory=directory
+        )
+        try:
+            for chunk in chunks:
+                counts = self._count([doc.data for doc in chunk])
+                for doc, weighted in zip(chunk, counts):
+                    accumulator.add(cls=doc.target, counts=weighted)
+
+            # Merged counts are consumed one class at a time, never held
+            # beyond the statistics and nodes of the model itself
+            return self._fit_classes(
+                documents=dict(accumulator.documents),
+                by_class=self._stream(accumulator),
             )
+        finally:
+            accumulator.close()
+
+    def _stream(
+        self, accumulator: SpillingAccumulator
+    ) -> Iterator[Tuple[str, Dict[str, Tuple[int, int]]]]:
+        """Groups merged accumulator counts by classification, checking
+        'memory_limit' before each classification is built.
+
+        Parameters
+        ----------
+        accumulator : SpillingAccumulator
+            Accumulator of all chunks
+
+        Returns
+        -------
+        Iterator[Tuple[str, Dict[str, Tuple[int, int]]]]
+            Classification and word (count, positive) tuples, by class
+
+        """
+        # Classes without keywords have documents but no merged counts
+        pending = iter(sorted(accumulator.documents))
+
+        size = 0
+        for cls, entries in itertools.groupby(
+            accumulator.merge(), key=itemgetter(0)
+        ):
+            for empty in itertools.takewhile(lambda c: c != cls, pending):
+                yield empty, dict()
+
+            keywords = {
+                word: (count, positive) for _, word, count, positive in entries
+            }
+            if self.memory_limit is not None:
+                size += memory.estimate({cls: keywords})
+                self._check_memory(size)
+
+            yield cls, keywords
+
+        for empty in pending:
+            yield empty, dict()
+
+    @classmethod
+    def from_statistics(
+        cls,
+        statistics: Statistics,
+        depth: float = 0.05,
+        combination_size: int = COMBINATION_SIZE,
+        cache_size: int = 0,
+        memory_limit: Optional[int] = None,
+    ) -> "WBN":
+        """Builds a fitted model from raw sufficient statistics.
+
+        Parameters
+        ----------
+        statistics : Statistics
+            Per class document counts and word (count, positive) tuples
 
-            # Build DAG with all node combinations
-            cls_dag.add_edges_from(ebunch_to_add=matrix)
-            assert cls_dag.is_directed()
+        depth : float
+            'depth' hyper-parameter of the model
 
-            # Store in instance variable for prediction
-            self.classes.append(
-                Classification(
-                    dag=cls_dag,
-                    cls=cls,
-                    corpus=list(set(keywords)),
+        combination_size : int
+            Number of nodes per edge of the model
+
+        cache_size : int
+            Maximum number of cached predictions of the model
+
+        memory_limit : Optional[int]
+            Estimated bytes of the model refused when exceeded
+
+        Returns
+        -------
+        WBN
+            Fitted model
+
+        """
+        model = cls(
+            depth=depth,
+            combination_size=combination_size,
+            cache_size=cache_size,
+            memory_limit=memory_limit,
+        )
+        model._fit_statistics(statistics)
+
+        return model
+
+    @classmethod
+    def merge(cls, *models: "WBN") -> "WBN":
+        """Merges fitted models by summing their sufficient statistics.
+
+        The merged model is identical to a single fit over the union of
+        the data of 'models', so shards can be fit on separate machines.
+
+        Parameters
+        ----------
+        models : WBN
+            Fitted models sharing hyper-parameters, the first is used
+
+        Returns
+        -------
+        WBN
+            Fitted model over all shards
+
+        Raises
+        ------
+        ModelCountError
+            No models to merge
+
+        """
+        if not models:
+            raise ModelCountError(len(models))
+
+        documents = Counter()  # type: Counter
+        words = defaultdict(dict)  # type: DefaultDict
+        for model in models:
+            documents.update(model.statistics.documents)
+            for target, keywords in model.statistics.words.items():
+                words[target] = cls._update(
+                    parent=words[target], child=keywords
                 )
-            )
 
-        return self.classes
+        return cls.from_statistics(
+            Statistics(documents=dict(documents), words=dict(words)),
+            depth=models[0].depth,
+            combination_size=models[0].combination_size,
+            cache_size=models[0].cache.maxsize,
+            memory_limit=models[0].memory_limit,
+        )
 
     def predict(self, data: List[DocumentData]) -> List[int]:
         """Predict class of for keywords in 'data'.
@@ -125,29 +288,138 @@ class WBN(object):
             Array of instance class predictions
 
         """
-        self.corpus = list(
-            set(
-                itertools.chain.from_iterable(
-                    fit_class.corpus for fit_class in self.classes
-                )
-            )
-        )
-
-        instances = []  # type: List[Dict[str, int]]
-        stemmer = PorterStemmer()  # Instantiate stemmer
-        for entry in data:
-            stemmed_entry = [stemmer.stem(word) for word in entry.tokens]
-            instances.append(
-                Counter(
-                    [word for word in stemmed_entry if word in self.corpus]
-                )
-            )
+        instances = self._transform(data)
 
         # Generate predictions for each instance
         predictions = list(map(self._evaluate, instances))
 
         return predictions
 
+    def predict_multi_depth(
+        self, data: List[DocumentData], depths: List[float]
+    ) -> np.ma.MaskedArray:
+        """Predict class of keywords in 'data' for several 'depth'
+        hyper-parameters in a single scoring pass.
+
+        Each instance is scored once and the prefix products of its sorted
+        edge probabilities are reused for every requested depth.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of cleaned words from input.
+
+        depths : List[float]
+            Array of 'depth' hyper-parameters to evaluate
+
+        Returns
+        -------
+        np.ma.MaskedArray
+            Matrix of instances x depths class predictions, masked where
+            the depth would raise 'MaxDepthExceededError'
+
+        """
+        instances = self._transform(data)
+        limits = [self._limit(depth) for depth in depths]
+
+        predictions = np.ma.masked_all(
+            (len(instances), len(limits)), dtype=int
+        )
+        for row, instance in enumerate(instances):
+            scored = self._score(instance, max(limits, default=0))
+            for col, limit in enumerate(limits):
+                classification_probabilities = self._select(scored, limit)
+                if classification_probabilities:
+                    predictions[row, col] = max(
+                        classification_probabilities, key=itemgetter(1)
+                    ).cls
+
+        return predictions
+
+    def predict_scores(self, data: List[DocumentData]) -> np.ma.MaskedArray:
+        """Score every class for keywords in 'data' in a single pass.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of cleaned words from input.
+
+        Returns
+        -------
+        np.ma.MaskedArray
+            Matrix of instances x encoded classes probabilities, masked
+            where a class has fewer edges than 'depth' requires; fully
+            masked rows would raise 'MaxDepthExceededError'
+
+        """
+        instances = self._transform(data)
+        limit = self._limit(self.depth)
+
+        scores = np.ma.masked_all(
+            (len(instances), len(self.targets)), dtype=float
+        )
+        for row, instance in enumerate(instances):
+            for score in self._select(self._score(instance, limit), limit):
+                scores[row, score.cls] = score.probability
+
+        return scores
+
+    def predict_top_n(
+        self, data: List[DocumentData], n: int
+    ) -> RankedPredictions:
+        """Rank the 'n' most probable classes for keywords in 'data'.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of cleaned words from input.
+
+        n : int
+            Number of ranked classes per instance
+
+        Returns
+        -------
+        RankedPredictions
+            Matrices of instances x n encoded classes and probabilities,
+            probabilities masked where 'predict_scores(...)' is masked
+
+        Raises
+        ------
+        RankCountError
+            'n' is less than 1
+
+        """
+        if n < 1:
+            raise RankCountError(n)
+
+        scores = self.predict_scores(data)
+
+        # Stable sort keeps 'predict' tie breaking, masked classes rank last
+        indices = np.argsort(-scores.filled(-np.inf), axis=1, kind="stable")
+        indices = indices[:, :n]
+
+        return RankedPredictions(
+            indices=indices,
+            scores=np.ma.array(
+                np.take_along_axis(scores.data, indices, axis=1),
+                mask=np.take_along_axis(
+                    np.ma.getmaskarray(scores), indices, axis=1
+                ),
+            ),
+        )
+
+    def memory_report(self) -> MemoryReport:
+        """Breaks down bytes held by the model per class and structure.
+
+        Returns
+        -------
+        MemoryReport
+            Bytes per class (nodes, edges, vocabulary) and per model
+            structure (statistics, corpus, predictions, cache)
+
+        """
+        return memory.report(self)
+
     def reverse_encode(self, target: List[int]) -> List[str]:
         """Reverse encodes int targets/predictions for metrics.
 
@@ -178,13 +450,163 @@ class WBN(object):
             Boolean if targets were set or not
 
         """
-        for idx, tgt in enumerate(list(set(target))):
+        # Sorted for an encoding independent of 'set' iteration order
+        for idx, tgt in enumerate(sorted(set(target))):
             self.targets[tgt] = idx
 
         self._reverse_encoded = {v: k for k, v in self.targets.items()}
 
         return bool(self.targets)
 
+    def _fit_statistics(self, statistics: Statistics) -> List[Classification]:
+        """Stores sufficient statistics and builds classifications from them.
+
+        Parameters
+        ----------
+        statistics : Statistics
+            Per class document counts and word (count, positive) tuples
+
+        Returns
+        -------
+        List[Classification]
+            Array of dag & corpus classifications
+
+        Raises
+        ------
+        MemoryLimitExceededError
+            Estimated model size exceeds 'memory_limit'
+
+        """
+        if self.memory_limit is not None:
+            self._check_memory(memory.estimate(statistics.words))
+
+        return self._fit_classes(
+            documents=statistics.documents,
+            by_class=(
+                (target, statistics.words[target])
+                for target in sorted(statistics.words)
+            ),
+        )
+
+    def _fit_classes(
+        self,
+        documents: Dict[str, int],
+        by_class: Iterable[Tuple[str, Dict[str, Tuple[int, int]]]],
+    ) -> List[Classification]:
+        """Builds classifications one at a time and stores the sufficient
+        statistics they were built from, without copying them.
+
+        Parameters
+        ----------
+        documents : Dict[str, int]
+            Number of instances per classification
+
+        by_class : Iterable[Tuple[str, Dict[str, Tuple[int, int]]]]
+            Classification and word (count, positive) tuples, by class
+
+        Returns
+        -------
+        List[Classification]
+            Array of dag & corpus classifications
+
+        """
+        words = dict()  # type: Dict[str, Dict[str, Tuple[int, int]]]
+        classes = list()  # type: List[Classification]
+        for cls, keywords in by_class:
+            words[cls] = keywords
+            classes.append(self._build(cls, keywords, documents[cls]))
+
+        # Refitting replaces the prior model, consistent with 'statistics'
+        self.statistics = Statistics(documents=documents, words=words)
+        self.targets = dict()
+        self._encode(target=list(documents))
+        self.cache.clear()  # Cached predictions belong to the prior model
+
+        # Store in instance variable for prediction
+        self.classes = classes
+        self.corpus = sorted(
+            set(
+                itertools.chain.from_iterable(
+                    fit_class.corpus for fit_class in self.classes
+                )
+            )
+        )
+
+        return self.classes
+
+    def _check_memory(self, size: int) -> None:
+        """Checks a model size estimated before building against
+        'memory_limit'.
+
+        Parameters
+        ----------
+        size : int
+            Estimated bytes of the model
+
+        Raises
+        ------
+        MemoryLimitExceededError
+            Estimated model size exceeds 'memory_limit'
+
+        """
+        memory_limit = self.memory_limit  # type: Any
+
+        if size > memory_limit:
+            raise MemoryLimitExceededError(size, memory_limit)
+
+        if size > memory_limit * MEMORY_WARNING_RATIO:
+            _LOGGER.warning(
+                "Estimated model size of %d bytes is over %d%% of memory "
+                "limit of %d bytes",
+                size,
+                MEMORY_WARNING_RATIO * 100,
+                memory_limit,
+            )
+
+    def _transform(self, data: List[DocumentData]) -> List[Dict[str, int]]:
+        """Stems tokens of 'data' and filters them to the fit corpus.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of cleaned words from input.
+
+        Returns
+        -------
+        List[Dict[str, int]]
+            Array of universe filtered word counts per instance
+
+        """
+        universe = set(self.corpus)
+
+        instances = []  # type: List[Dict[str, int]]
+        stemmer = PorterStemmer()  # Instantiate stemmer
+        for entry in data:
+            stemmed_entry = [stemmer.stem(word) for word in entry.tokens]
+            instances.append(
+                Counter(
+                    [word for word in stemmed_entry if word in universe]
+                )
+            )
+
+        return instances
+
+    def _limit(self, depth: float) -> int:
+        """Calculates number of edges kept for a 'depth' hyper-parameter.
+
+        Parameters
+        ----------
+        depth : float
+            Fraction of the corpus size
+
+        Returns
+        -------
+        int
+            Number of sorted edge probabilities to keep
+
+        """
+        return round(len(self.corpus) * depth)
+
     def _evaluate(self, instance: Dict[str, int]) -> int:
         """Iterate through and traverse class level dags
         in order to establish weighted match score.
@@ -200,98 +622,307 @@ class WBN(object):
             Predicted classification of instance
 
         """
-        classification_probabilities = (
-            list()
-        )  # type: List[ClassificationScore]
-        for classification in self.classes:
-            edge_probabilities = list()  # type: List[Tuple[float, list]]
-            for edge in classification.dag.edges:
-                edge_probability = self._score_edge(
-                    edge=edge, instance=instance
-                )  # type: ignore
-                if edge_probability:
-                    edge = edge + (1 + edge_probability,)  # Assign edge probability
-                    edge_probabilities.append((edge_probability, edge))
-
-                # Sort edge scores by probability
-                sorted_edge_probabilities = sorted(
-                    edge_probabilities, reverse=True, key=itemgetter(0)
-                )
-
-                # Calculate depth
-                depth = round(len(self.corpus) * self.depth)
-                if len(sorted_edge_probabilities) >= depth:
-                    # Limit probabilities to 'depth' hyper-parameter
-                    depth_limited = sorted_edge_probabilities[:depth]
-
-                    # Destructure probabilities and edges
-                    probabilities, edges = list(zip(*depth_limited))
-
-                    # Create ClassificationScore to scores
-                    classification_probabilities.append(
-                        ClassificationScore(
-                            self.targets[classification.cls],
-                            np.prod(probabilities),
-                            edges,
-                        )
-                    )
+        limit = self._limit(self.depth)
+
+        key = None  # type: Optional[tuple]
+        prediction = None  # type: Optional[ClassificationScore]
+        if self.cache.maxsize:
+            # Scores depend on the words present only, not their counts
+            key = (frozenset(instance), limit, self.combination_size)
+            prediction = self.cache.get(key)
+
+        if prediction is None:
+            classification_probabilities = self._select(
+                self._score(instance, limit), limit
+            )
 
-        if not classification_probabilities:
-            raise MaxDepthExceededError(self.depth)
+            if not classification_probabilities:
+                raise MaxDepthExceededError(self.depth)
 
-        prediction = max(classification_probabilities, key=itemgetter(1))
+            prediction = max(classification_probabilities, key=itemgetter(1))
+            if key is not None:
+                self.cache.put(key, prediction)
 
         # Store verbose prediction with probability and edges
         self.predictions.append(prediction)
 
         return prediction.cls
 
+    def _score(
+        self, instance: Dict[str, int], limit: int
+    ) -> List[Tuple[int, np.ndarray, List[tuple]]]:
+        """Scores node combinations of every class level dag
+        against 'instance'.
+
+        Nodes are looked up by the words of 'instance' and combinations are
+        enumerated best-first over them only, so cost grows with the
+        instance and 'limit' rather than the class vocabulary.
+
+        Parameters
+        ----------
+        instance : Dict[str, int]
+            Instance of universe filtered words
+
+        limit : int
+            Largest number of sorted edge probabilities to be selected
+
+        Returns
+        -------
+        List[Tuple[int, np.ndarray, List[tuple]]]
+            Encoded class, prefix products of the sorted edge probabilities
+            and the sorted edges for each classification
+
+        """
+        scored = list()  # type: List[Tuple[int, np.ndarray, List[tuple]]]
+        for classification in self.classes:
+            # Sorted words keep the dag order of nodes built in '_build'
+            present = [
+                classification.nodes[word]
+                for word in sorted(instance)
+                if word in classification.nodes
+            ]
+            nodes = [(self._score_node(node), node) for node in present]
+            scored.append(
+                (self.targets[classification.cls],)
+                + self._combine(nodes, limit, self.combination_size)
+            )
+
+        return scored
+
     @staticmethod
-    def _score_edge(
-        edge: Tuple[Attribute, Attribute], instance: Dict[str, int]
-    ) -> float:
-        """Calculates score for edge of dag via parent/child node in order to
-        identify correlation to instance.
+    def _combine(
+        nodes: List[Tuple[float, Any]], limit: int, combination_size: int
+    ) -> Tuple[np.ndarray, List[tuple]]:
+        """Enumerates the 'limit' most probable node combinations, most
+        probable first, in O(limit * combination_size * log) time.
 
-        Using a Bayesian approach we calculate
+        Parameters
+        ----------
+        nodes : List[Tuple[float, Any]]
+            Scores and nodes present in the instance, in dag order
+
+        limit : int
+            Largest number of sorted edge probabilities to be selected
+
+        combination_size : int
+            Number of nodes per edge
+
+        Returns
+        -------
+        Tuple[np.ndarray, List[tuple]]
+            Prefix products of the sorted edge probabilities and the
+            sorted edges
+
+        """
+        # Node ranks by descending score, ties kept in dag order
+        ranked = sorted(range(len(nodes)), key=lambda idx: -nodes[idx][0])
+
+        def probability(ranks: Tuple[int, ...]) -> Tuple[float, tuple]:
+            positions = sorted(ranked[rank] for rank in ranks)
+            factors, edge = zip(*[nodes[pos] for pos in positions])
+            return reduce(mul, factors), edge
+
+        edge_probabilities = list()  # type: List[Tuple[float, tuple]]
+        if limit > 0 and len(nodes) >= combination_size:
+            # Best-first enumeration: node scores are positive, so moving
+            # any rank down never raises the product of a combination
+            start = tuple(range(combination_size))
+            heap = [(-probability(start)[0], start)]
+            seen = {start}
+            while heap and len(edge_probabilities) < limit:
+                _, ranks = heapq.heappop(heap)
+                edge_probability, edge = probability(ranks)
+                # Assign edge probability
+                edge = edge + (1 + edge_probability,)
+                edge_probabilities.append((edge_probability, edge))
+
+                for pos in range(combination_size):
+                    bound = (
+                        ranks[pos + 1]
+                        if pos + 1 < combination_size
+                        else len(nodes)
+                    )
+                    if ranks[pos] + 1 < bound:
+                        bumped = list(ranks)
+                        bumped[pos] += 1
+                        child = tuple(bumped)
+                        if child not in seen:
+                            seen.add(child)
+                            heapq.heappush(
+                                heap, (-probability(child)[0], child)
+                            )
+
+        # Prefix products let any depth be read off in constant time
+        probabilities = [prob for prob, _ in edge_probabilities]
+
+        return (
+            np.cumprod(probabilities),
+            [edge for _, edge in edge_probabilities],
+        )
+
+    @staticmethod
+    def _select(
+        scored: List[Tuple[int, np.ndarray, List[tuple]]], limit: int
+    ) -> List[ClassificationScore]:
+        """Limits scored classifications to 'limit' edges.
 
         Parameters
         ----------
-        edge : Tuple[Attribute, Attribute]
-            Edge parent/child node of dag
+        scored : List[Tuple[int, np.ndarray, List[tuple]]]
+            Output of '_score(...)' for an instance
 
-        instance : Dict[str, int]
-            Instance to be evaluated against edge
+        limit : int
+            Number of sorted edge probabilities to keep
 
         Returns
         -------
-        float
-            Edge score against instance
+        List[ClassificationScore]
+            Scores of the classifications with at least 'limit' edges, none
+            when 'limit' is 0 or negative as a classification needs an edge
+            to score
 
         """
-        # De-structure nodes of edge
-        parent, child = edge
+        classification_probabilities = (
+            list()
+        )  # type: List[ClassificationScore]
+        if limit <= 0:
+            return classification_probabilities
+
+        for cls, cumulative, edges in scored:
+            if len(edges) >= limit:
+                # Limit probabilities to 'depth' hyper-parameter
+                classification_probabilities.append(
+                    ClassificationScore(
+                        cls, cumulative[limit - 1], edges[:limit]
+                    )
+                )
 
-        words = [parent.word, child.word]
-        if any(word not in instance for word in words):
-            return 0  # Parent/Child edge not indicative of correlation
+        return classification_probabilities
 
+    @staticmethod
+    def _score_node(node: Attribute) -> float:
+        """Calculates weighted conditional probability of a dag node. The
+        score of a node combination (edge) is the product of its node scores.
+
+        Using a Bayesian approach we calculate
+
+        Parameters
+        ----------
+        node : Attribute
+            Node of dag
+
+        Returns
+        -------
+        float
+            Node score
+
+        """
         # NOTE: Conditional probability calculation
         # L: Class (classification)
-        # P: Parent (parent node word in edge)
-        # C: Child (child node word in edge)
-        # wp: Parent word weight of keywords
-        # wc: Child word weight of keywords
-        cls_given_parent = parent.positive / parent.total  # Pr(L | P)
-        cls_given_child = child.positive / child.total  # Pr(L | C)
-
-        weighted_joint_probability = (
-            cls_given_parent * (1 + parent.weight)
-        ) * (
-            cls_given_child * (1 + child.weight)
-        )  # Pr(L | P(wp), C(wc))
-
-        return weighted_joint_probability
+        # N: Node (word in edge)
+        # wn: Node word weight of keywords
+        cls_given_node = node.positive / node.total  # Pr(L | N)
+
+        return cls_given_node * (1 + node.weight)  # Pr(L | N(wn))
+
+    @staticmethod
+    def _count(data: List[DocumentData]) -> List[Dict[str, int]]:
+        """Stems keywords of 'data' into per instance word counts.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of annotated keywords
+
+        Returns
+        -------
+        List[Dict[str, int]]
+            Array of stemmed keyword counts per instance
+
+        """
+        stemmer = PorterStemmer()  # Instantiate stemmer
+        return [
+            Counter([stemmer.stem(word) for word in entry.keywords])
+            for entry in data
+        ]
+
+    @classmethod
+    def _aggregate(
+        cls, counts: List[Dict[str, int]], target: List[str]
+    ) -> DefaultDict:
+        """Aggregates per instance word counts by classification.
+
+        Parameters
+        ----------
+        counts : List[Dict[str, int]]
+            Array of stemmed keyword counts per instance
+
+        target : List[str]
+            Array of target classifications
+
+        Returns
+        -------
+        DefaultDict
+            Mapping of classification to word (count, positive) tuples
+
+        """
+        by_class = defaultdict(dict)  # type: DefaultDict
+        for idx, weighted in enumerate(counts):
+            # Injects value for probability table
+            by_word = {k: (v, 1) for k, v in weighted.items()}
+            # Create a weighted dict for weighting
+            by_class[target[idx]] = cls._update(
+                parent=by_class[target[idx]], child=by_word
+            )
+
+        return by_class
+
+    @staticmethod
+    def _build(
+        cls: str, keywords: Dict[str, Tuple[int, int]], documents: int
+    ) -> Classification:
+        """Builds directed acyclic graph and corpus of a classification
+        from aggregated word counts.
+
+        Parameters
+        ----------
+        cls : str
+            Classification
+
+        keywords : Dict[str, Tuple[int, int]]
+            Mapping of word to (count, positive) tuples
+
+        documents : int
+            Number of instances of the classification
+
+        Returns
+        -------
+        Classification
+            Dag, corpus & node index classification
+
+        """
+        total_words = sum([kw[0] for kw in keywords.values()])
+        cls_dag = nx.DiGraph()
+        nodes = [
+            Attribute(
+                word=word,
+                weight=count / total_words,
+                positive=positive,
+                negative=documents - positive,  # Total minus positive values
+            )
+            for word, (count, positive) in sorted(keywords.items())
+        ]
+
+        # Node combinations (edges) are enumerated at prediction
+        cls_dag.add_nodes_from(nodes_for_adding=nodes)
+        assert cls_dag.is_directed()
+
+        return Classification(
+            dag=cls_dag,
+            cls=cls,
+            corpus=sorted(keywords),
+            nodes={node.word: node for node in nodes},
+        )
 
     @staticmethod
     def _update(
@@ -0,0 +1,305 @@
+"""Compact Model Representation for WBN."""
+import bisect
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from nltk import PorterStemmer
+
+from wbn import memory
+from wbn.classifier import WBN
+from wbn.errors import MaxDepthExceededError
+from wbn.object import (
+    CompactClassification,
+    CompactReport,
+    DocumentData,
+)
+
+PRECISIONS = {
+    "float64": np.float64,
+    "float32": np.float32,
+    "uint16": np.uint16,
+    "uint8": np.uint8,
+}
+
+
+class CompactModel(object):
+    """Read-only fitted WBN with a shared string table and per class node
+    records stored as arrays of quantized node scores.
+
+    Edges are not stored, predictions enumerate node combinations of the
+    instance as 'WBN' does.
+    """
+
+    def __init__(
+        self,
+        words: List[str],
+        classes: List[CompactClassification],
+        targets: Dict[str, int],
+        depth: float,
+        combination_size: int,
+    ):
+        self.words = words  # Sorted string table shared by all classes
+        self.classes = classes
+        self.targets = targets
+        self.depth = depth
+        self.combination_size = combination_size
+        self._reverse_encoded = {v: k for k, v in targets.items()}
+
+    @classmethod
+    def from_model(
+        cls, model: WBN, precision: str = "float32"
+    ) -> "CompactModel":
+        """Builds a compact model from a fitted 'model'.
+
+        Parameters
+        ----------
+        model : WBN
+            Fitted model
+
+        precision : str
+            Node score dtype, one of 'PRECISIONS'
+
+        Returns
+        -------
+        CompactModel
+            Compact representation of 'model'
+
+        """
+        words = list(model.corpus)
+        index = {word: idx for idx, word in enumerate(words)}
+        id_dtype = np.min_scalar_type(len(words))
+
+        classes = list()  # type: List[CompactClassification]
+        for classification in model.classes:
+            nodes = list(classification.dag.nodes)
+            factors, scale, offset = _quantize(
+                np.array([WBN._score_node(node) for node in nodes]),
+                PRECISIONS[precision],
+            )
+            classes.append(
+                CompactClassification(
+                    cls=classification.cls,
+                    words=np.array(
+                        [index[node.word] for node in nodes], dtype=id_dtype
+                    ),
+                    factors=factors,
+                    scale=scale,
+                    offset=offset,
+                )
+            )
+
+        return cls(
+            words=words,
+            classes=classes,
+            targets=dict(model.targets),
+            depth=model.depth,
+            combination_size=model.combination_size,
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Resident bytes of the compact model."""
+        return memory.sizeof(self, set())
+
+    def predict(self, data: List[DocumentData]) -> List[int]:
+        """Predict class of for keywords in 'data'.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of cleaned words from input.
+
+        Returns
+        -------
+        List[int]
+            Array of instance class predictions
+
+        """
+        return list(map(self._evaluate, self._transform(data)))
+
+    def reverse_encode(self, target: List[int]) -> List[str]:
+        """Reverse encodes int targets/predictions for metrics.
+
+        Parameters
+        ----------
+        target : List[int]
+            Array of encoded targets/predictions
+
+        Returns
+        -------
+        List[str]
+            Reverse encoded array of targets/predictions
+
+        """
+        return [
+            self._reverse_encoded.get(val) for val in target  # type: ignore
+        ]
+
+    def _transform(self, data: List[DocumentData]) -> List[np.ndarray]:
+        """Stems tokens of 'data' into string table ids.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of cleaned words from input.
+
+        Returns
+        -------
+        List[np.ndarray]
+            Array of string table ids present per instance
+
+        """
+        instances = list()  # type: List[np.ndarray]
+        stemmer = PorterStemmer()  # Instantiate stemmer
+        for entry in data:
+            ids = set()
+            for word in set(stemmer.stem(token) for token in entry.tokens):
+                idx = bisect.bisect_left(self.words, word)
+                if idx < len(self.words) and self.words[idx] == word:
+                    ids.add(idx)
+            instances.append(np.array(sorted(ids), dtype=int))
+
+        return instances
+
+    def _evaluate(self, instance: np.ndarray) -> int:
+        """Scores node combinations of every class against 'instance'.
+
+        Parameters
+        ----------
+        instance : np.ndarray
+            String table ids present in instance
+
+        Returns
+        -------
+        int
+            Predicted classification of instance
+
+        """
+        limit = round(len(self.words) * self.depth)
+        scored = list()
+        for classification in self.classes:
+            present = np.isin(classification.words, instance)
+            factors = (
+                classification.offset
+                + classification.factors[present].astype(float)
+                * classification.scale
+            )
+            nodes = list(
+                zip(factors.tolist(), classification.words[present].tolist())
+            )
+            scored.append(
+                (self.targets[classification.cls],)
+                + WBN._combine(nodes, limit, self.combination_size)
+            )
+
+        classification_probabilities = WBN._select(scored, limit)
+        if not classification_probabilities:
+            raise MaxDepthExceededError(self.depth)
+
+        return max(classification_probabilities, key=itemgetter(1)).cls
+
+
+def compare(
+    model: WBN,
+    data: List[DocumentData],
+    target: List[str],
+    precisions: Optional[List[str]] = None,
+) -> List[CompactReport]:
+    """Reports size and accuracy of compact models per precision.
+
+    Parameters
+    ----------
+    model : WBN
+        Fitted model
+
+    data : List[DocumentData]
+        Array of cleaned words from input.
+
+    target : List[str]
+        Array of target classifications
+
+    precisions : Optional[List[str]]
+        Node score dtypes, all of 'PRECISIONS' if None
+
+    Returns
+    -------
+    List[CompactReport]
+        Size, size ratio, agreement and accuracy per precision
+
+    """
+    full = model.memory_report()
+    full_bytes = full.total - full.predictions - full.cache
+
+    # An uncached model sharing the statistics leaves the cache, its
+    # counters and the verbose predictions of 'model' untouched
+    uncached = WBN.from_statistics(
+        model.statistics,
+        depth=model.depth,
+        combination_size=model.combination_size,
+    )
+    expected = _predict_each(uncached.predict, data)
+
+    reports = list()  # type: List[CompactReport]
+    for precision in precisions or list(PRECISIONS):
+        compact = CompactModel.from_model(model, precision=precision)
+        predictions = _predict_each(compact.predict, data)
+        labels = compact.reverse_encode(predictions)  # type: ignore
+        reports.append(
+            CompactReport(
+                precision=precision,
+                nbytes=compact.nbytes,
+                ratio=full_bytes / compact.nbytes,
+                agreement=_matching(predictions, expected),
+                accuracy=_matching(labels, target),
+            )
+        )
+
+    return reports
+
+
+def _predict_each(
+    predict: Callable[[List[DocumentData]], List[int]],
+    data: List[DocumentData],
+) -> List[Optional[int]]:
+    """Predicts instances one at a time, None where depth is exceeded."""
+    predictions = list()  # type: List[Optional[int]]
+    for entry in data:
+        try:
+            predictions.extend(predict([entry]))
+        except MaxDepthExceededError:
+            predictions.append(None)
+
+    return predictions
+
+
+def _matching(values: list, expected: list) -> float:
+    """Fraction of 'values' equal to 'expected'."""
+    return sum(a == b for a, b in zip(values, expected)) / len(expected)
+
+
+def _quantize(factors: np.ndarray, dtype: type) -> tuple:
+    """Casts node scores to 'dtype', linearly quantizing integer dtypes.
+
+    Parameters
+    ----------
+    factors : np.ndarray
+        Node scores
+
+    dtype : type
+        Target dtype
+
+    Returns
+    -------
+    tuple
+        Stored scores, scale and offset
+
+    """
+    if np.issubdtype(dtype, np.floating):
+        return factors.astype(dtype), 1.0, 0.0
+
+    low = float(factors.min()) if len(factors) else 0.0
+    high = float(factors.max()) if len(factors) else 0.0
+    scale = (high - low) / np.iinfo(dtype).max or 1.0
+
+    return np.round((factors - low) / scale).astype(dtype), scale, low
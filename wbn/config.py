@@ -2,3 +2,13 @@
 
 
 COMBINATION_SIZE = 2
+
+MEMORY_BUDGET = 256 * 1024 ** 2  # Bytes held by 'fit_stream' before spilling
+SPILL_ENTRY_BYTES = 240  # Estimated bytes per accumulated (class, word)
+
+# Estimated bytes of a fitted model, see 'wbn.memory.estimate'
+NODE_BYTES = 300  # Attribute, word, node attribute dict and index entry
+ADJACENCY_BYTES = 220  # Empty successor and predecessor dicts per node
+STATISTICS_BYTES = 90  # Statistics entry and (count, positive) tuple
+MEMORY_WARNING_RATIO = 0.8  # Fraction of 'memory_limit' logged as warning
+SPILL_FAN_IN = 8  # Spilled runs of a tier merged into one of the next
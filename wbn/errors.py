@@ -31,3 +31,79 @@ class MaxDepthExceededError(WBNException):
         return "Max probability depth of {} exceeded for all classifications".format(
             self.depth
         )
+
+
+class FoldCountError(WBNException):
+    """FoldCountError Exception."""
+
+    def __init__(self, k: int, instances: int):
+        self.k = k
+        self.instances = instances
+
+    def __str__(self) -> str:
+        return (
+            "Number of folds: {} must be between 2 and number of "
+            "instances: {}".format(self.k, self.instances)
+        )
+
+
+class MemoryLimitExceededError(WBNException):
+    """MemoryLimitExceededError Exception."""
+
+    def __init__(self, estimate: int, limit: int):
+        self.estimate = estimate
+        self.limit = limit
+
+    def __str__(self) -> str:
+        return (
+            "Estimated model size of {} bytes exceeds memory limit of {} "
+            "bytes".format(self.estimate, self.limit)
+        )
+
+
+class ModelCountError(WBNException):
+    """ModelCountError Exception."""
+
+    def __init__(self, models: int):
+        self.models = models
+
+    def __str__(self) -> str:
+        return "Number of models: {} must be at least 1 to merge".format(
+            self.models
+        )
+
+
+class CombinationSizeError(WBNException):
+    """CombinationSizeError Exception."""
+
+    def __init__(self, combination_size: int):
+        self.combination_size = combination_size
+
+    def __str__(self) -> str:
+        return "Combination size: {} must be at least 1".format(
+            self.combination_size
+        )
+
+
+class WarmShareError(WBNException):
+    """WarmShareError Exception."""
+
+    def __init__(self, warm_share: float):
+        self.warm_share = warm_share
+
+    def __str__(self) -> str:
+        return "Warm share: {} must be greater than 0 and at most 1".format(
+            self.warm_share
+        )
+
+
+class RankCountError(WBNException):
+    """RankCountError Exception."""
+
+    def __init__(self, n: int):
+        self.n = n
+
+    def __str__(self) -> str:
+        return "Number of ranked classes: {} must be at least 1".format(
+            self.n
+        )
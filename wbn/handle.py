@@ -0,0 +1,173 @@
+"""Hot-Swappable Model Handle for WBN."""
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from wbn.classifier import WBN
+from wbn.errors import MaxDepthExceededError, WarmShareError
+from wbn.object import DocumentData, VersionedPredictions
+
+
+class ModelHandle(object):
+    """Handle on a fitted WBN that can be replaced without downtime.
+
+    Each prediction reads the current (version, model) pair once, so
+    in-flight predictions finish on the model they started with while new
+    ones are routed to the swapped in model.
+
+    Parameters
+    ----------
+    model : WBN
+        Fitted model to be served
+
+    history : Optional[int]
+        Number of recent documents kept for warming, defaults to the cache
+        size of 'model'
+
+    warm_share : float
+        Fraction of wall time, greater than 0 and at most 1, the warm-up
+        may spend predicting, it sleeps for the remainder so serving
+        threads keep the GIL
+
+    Raises
+    ------
+    WarmShareError
+        'warm_share' is not greater than 0 and at most 1
+
+    """
+
+    def __init__(
+        self,
+        model: WBN,
+        history: Optional[int] = None,
+        warm_share: float = 0.2,
+    ):
+        if not 0 < warm_share <= 1:
+            raise WarmShareError(warm_share)
+
+        self.warm_share = warm_share
+        self._current: Tuple[int, WBN] = (1, model)
+        self._recent: Deque[DocumentData] = deque(
+            maxlen=model.cache.maxsize if history is None else history
+        )
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def version(self) -> int:
+        """Version of the current model."""
+        return self._current[0]
+
+    @property
+    def model(self) -> WBN:
+        """Current model."""
+        return self._current[1]
+
+    def predict(self, data: List[DocumentData]) -> VersionedPredictions:
+        """Predict class of keywords in 'data' with the current model.
+
+        Parameters
+        ----------
+        data : List[DocumentData]
+            Array of cleaned words from input.
+
+        Returns
+        -------
+        VersionedPredictions
+            Model version, encoded and reverse encoded predictions
+
+        """
+        version, model = self._current
+        self._recent.extend(data)
+
+        predictions = model.predict(data)
+
+        return VersionedPredictions(
+            version, predictions, model.reverse_encode(predictions)
+        )
+
+    def swap(self, model: WBN, warm: bool = True) -> int:
+        """Warms 'model' with recent traffic and atomically swaps it in.
+
+        Parameters
+        ----------
+        model : WBN
+            Fitted model to be swapped in
+
+        warm : bool
+            Predict recent traffic to populate the caches of 'model'
+
+        Returns
+        -------
+        int
+            Version of the swapped in model
+
+        """
+        if warm:
+            self._warm(model, size=len(self.model.cache))
+
+        with self._lock:
+            version = self._current[0] + 1
+            self._current = (version, model)
+
+        return version
+
+    def load(self, loader: Callable[[], WBN], warm: bool = True) -> Future:
+        """Loads a fitted model in the background and swaps it in.
+
+        Parameters
+        ----------
+        loader : Callable[[], WBN]
+            Callable returning a fitted model, e.g. fitting or unpickling
+
+        warm : bool
+            Predict recent traffic to populate the caches of the model
+
+        Returns
+        -------
+        Future
+            Resolves to the version of the swapped in model
+
+        """
+        return self._executor.submit(
+            lambda: self.swap(model=loader(), warm=warm)
+        )
+
+    def close(self) -> None:
+        """Waits for pending loads and shuts down the background worker."""
+        self._executor.shutdown(wait=True)
+
+    def _warm(self, model: WBN, size: int) -> None:
+        """Predicts the most recent distinct traffic, up to 'size' documents,
+        without keeping verbose predictions.
+
+        Parameters
+        ----------
+        model : WBN
+            Fitted model to be warmed
+
+        size : int
+            Number of distinct documents to warm, e.g. the entries held by
+            the cache of the current model
+
+        """
+        size = min(size, model.cache.maxsize)
+        distinct: Dict[Tuple[str, ...], DocumentData] = dict()
+        for entry in reversed(list(self._recent)):
+            if len(distinct) >= size:
+                break
+            distinct.setdefault(tuple(entry.tokens), entry)
+
+        recorded = len(model.predictions)
+        for entry in distinct.values():
+            start = time.perf_counter()
+            try:
+                model.predict([entry])
+            except MaxDepthExceededError:
+                pass
+            elapsed = time.perf_counter() - start
+            time.sleep(elapsed * (1 - self.warm_share) / self.warm_share)
+
+        del model.predictions[recorded:]
@@ -0,0 +1,121 @@
+"""Memory Accounting for WBN."""
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Set, Tuple
+
+from wbn.config import ADJACENCY_BYTES, NODE_BYTES, STATISTICS_BYTES
+from wbn.object import MemoryReport
+
+if TYPE_CHECKING:  # pragma: no cover
+    from wbn.classifier import WBN
+
+
+def sizeof(obj: Any, seen: Set[int]) -> int:
+    """Recursively calculates bytes of 'obj' not already in 'seen'.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to be measured
+
+    seen : Set[int]
+        Ids of objects already measured, shared objects count once
+
+    Returns
+    -------
+    int
+        Bytes of 'obj' and its unseen referents
+
+    """
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(
+            sizeof(key, seen) + sizeof(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += sizeof(vars(obj), seen)
+
+    return size
+
+
+def report(model: "WBN") -> MemoryReport:
+    """Breaks down bytes of a fitted model by class and structure.
+
+    Structures are measured in report order and objects shared between
+    them, such as words, are attributed to the first one.
+
+    Parameters
+    ----------
+    model : WBN
+        Fitted model
+
+    Returns
+    -------
+    MemoryReport
+        Bytes per class (nodes, edges, vocabulary) and per model structure
+
+    """
+    seen = set()  # type: Set[int]
+    views = list()
+    classes = dict()  # type: Dict[str, Dict[str, int]]
+    for classification in model.classes:
+        dag = classification.dag
+        # Public views are measured as dict copies, which are kept alive
+        # so their ids are not reused while 'seen' is in use
+        nodes = dict(dag.nodes(data=True))
+        succ = {node: dict(nbrs) for node, nbrs in dag.succ.items()}
+        pred = {node: dict(nbrs) for node, nbrs in dag.pred.items()}
+        views.extend([nodes, succ, pred])
+        classes[classification.cls] = {
+            "nodes": sizeof(nodes, seen) + sizeof(classification.nodes, seen),
+            "edges": sizeof(succ, seen) + sizeof(pred, seen),
+            "vocabulary": sizeof(classification.corpus, seen),
+        }
+
+    structures = {
+        "statistics": sizeof(model.statistics, seen),
+        "corpus": sizeof(model.corpus, seen),
+        "predictions": sizeof(model.predictions, seen),
+        "cache": sizeof(model.cache._entries, seen),
+    }
+    total = sum(sum(sizes.values()) for sizes in classes.values()) + sum(
+        structures.values()
+    )
+
+    return MemoryReport(classes=classes, total=total, **structures)
+
+
+def estimate(words: Dict[str, Dict[str, Tuple[int, int]]]) -> int:
+    """Estimates bytes of the model built from 'words' from vocabulary
+    sizes alone, before any graph is built.
+
+    Covers the classifications, the statistics kept by the model and its
+    corpus, the structures counted by 'report' less predictions and cache.
+
+    Parameters
+    ----------
+    words : Dict[str, Dict[str, Tuple[int, int]]]
+        Mapping of classification to word (count, positive) tuples
+
+    Returns
+    -------
+    int
+        Estimated bytes of the dags, corpora and statistics
+
+    """
+    total = 0
+    for keywords in words.values():
+        vocabulary = len(keywords)
+        total += vocabulary * (NODE_BYTES + ADJACENCY_BYTES + STATISTICS_BYTES)
+        total += sys.getsizeof([None] * vocabulary)  # Corpus list
+
+    # Model corpus over the distinct words of all classes
+    distinct = len(set().union(*words.values())) if words else 0
+
+    return total + sys.getsizeof([None] * distinct)
@@ -1,7 +1,8 @@
 """Reusable Objects for WBN."""
-from typing import List, NamedTuple, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import networkx as nx
+import numpy as np
 
 
 class Attribute(NamedTuple):
@@ -61,6 +62,7 @@ class Classification(NamedTuple):
     dag: nx.DiGraph
     cls: str
     corpus: List[str]
+    nodes: Dict[str, Attribute]  # Dag nodes by word for instance lookups
 
 
 class ClassificationScore(NamedTuple):
@@ -69,3 +71,73 @@ class ClassificationScore(NamedTuple):
     cls: int
     probability: float
     edges: List[Tuple[Attribute, Attribute]]
+
+
+class Fold(NamedTuple):
+    """Cross-validation fold holding held-out indices and predictions."""
+
+    indices: List[int]
+    predictions: List[Optional[str]]  # None where 'depth' is exceeded
+
+
+class Statistics(NamedTuple):
+    """Sufficient statistics holding per class document and word counts."""
+
+    documents: Dict[str, int]  # Number of instances per class
+    words: Dict[str, Dict[str, Tuple[int, int]]]  # Word (count, positive)
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics holding hits, misses, evictions and sizes."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class VersionedPredictions(NamedTuple):
+    """Prediction output holding model version, predictions and labels."""
+
+    version: int
+    predictions: List[int]
+    labels: List[str]
+
+
+class MemoryReport(NamedTuple):
+    """Memory report holding bytes per class and per model structure."""
+
+    classes: Dict[str, Dict[str, int]]  # Nodes, edges & vocabulary by class
+    statistics: int
+    corpus: int
+    predictions: int  # Verbose predictions with probability and edges
+    cache: int
+    total: int
+
+
+class CompactClassification(NamedTuple):
+    """Compact classification holding node records as arrays."""
+
+    cls: str
+    words: np.ndarray  # Node word ids into the shared string table
+    factors: np.ndarray  # Node scores, quantized for integer dtypes
+    scale: float  # Node score = offset + factor * scale
+    offset: float
+
+
+class CompactReport(NamedTuple):
+    """Compact model report holding size and accuracy per precision."""
+
+    precision: str
+    nbytes: int
+    ratio: float  # Full model bytes over compact model bytes
+    agreement: float  # Fraction of predictions matching the full model
+    accuracy: float
+
+
+class RankedPredictions(NamedTuple):
+    """Ranked prediction output holding class and probability matrices."""
+
+    indices: np.ndarray  # Encoded classes, most probable first
+    scores: np.ma.MaskedArray
@@ -0,0 +1,176 @@
+"""Model Validation for WBN."""
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import DefaultDict, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from wbn.classifier import WBN
+from wbn.config import COMBINATION_SIZE
+from wbn.errors import FoldCountError, MaxDepthExceededError
+from wbn.object import DocumentData, Fold, Statistics
+
+
+def cross_validate(
+    data: List[DocumentData],
+    target: List[str],
+    k: int = 5,
+    depth: float = 0.05,
+    combination_size: int = COMBINATION_SIZE,
+    n_jobs: int = 1,
+) -> List[Fold]:
+    """K-fold cross-validation of WBN without refitting per fold.
+
+    Keywords are stemmed and aggregated once; each fold's model is derived
+    by subtracting the held-out instances from the global totals.
+
+    Parameters
+    ----------
+    data : List[DocumentData]
+        Array of annotated keywords
+
+    target : List[str]
+        Array of target classifications
+
+    k : int
+        Number of contiguous folds
+
+    depth : float
+        'depth' hyper-parameter of each fold model
+
+    combination_size : int
+        Number of nodes per edge of each fold model
+
+    n_jobs : int
+        Number of worker processes, folds run in-process when 1
+
+    Returns
+    -------
+    List[Fold]
+        Held-out indices and reverse encoded predictions per fold, None
+        for instances exceeding 'depth'
+
+    Raises
+    ------
+    FoldCountError
+        'k' is less than 2 or greater than the number of instances
+
+    """
+    WBN._validate(data, target)
+    if not 2 <= k <= len(data):
+        raise FoldCountError(k, len(data))
+
+    counts = WBN._count(data)
+    totals = WBN._aggregate(counts=counts, target=target)
+
+    tasks = list()  # type: List[Tuple]
+    for fold in np.array_split(np.arange(len(data)), k):
+        index = fold.tolist()
+        held = set(index)
+        tasks.append(
+            (
+                index,
+                [data[idx] for idx in index],
+                WBN._aggregate(
+                    counts=[counts[idx] for idx in index],
+                    target=[target[idx] for idx in index],
+                ),
+                [tgt for idx, tgt in enumerate(target) if idx not in held],
+                totals,
+                depth,
+                combination_size,
+            )
+        )
+
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            return list(executor.map(_fold, tasks))
+
+    return list(map(_fold, tasks))
+
+
+def _fold(task: Tuple) -> Fold:
+    """Fits a fold model from global totals and predicts its held-out data.
+
+    Parameters
+    ----------
+    task : Tuple
+        Held-out indices, held-out data, held-out aggregate, training
+        targets, global aggregate, 'depth' and 'combination_size'
+        hyper-parameters
+
+    Returns
+    -------
+    Fold
+        Held-out indices and reverse encoded predictions, None where
+        'depth' is exceeded
+
+    """
+    (
+        index,
+        data,
+        held_out,
+        train_target,
+        totals,
+        depth,
+        combination_size,
+    ) = task
+
+    model = WBN.from_statistics(
+        Statistics(
+            documents=dict(Counter(train_target)),
+            words=_subtract(totals, held_out, train_target),
+        ),
+        depth=depth,
+        combination_size=combination_size,
+    )
+
+    # Stemmed once, each instance is evaluated on its own
+    return Fold(
+        index,
+        [_predict(model, instance) for instance in model._transform(data)],
+    )
+
+
+def _predict(model: WBN, instance: Dict[str, int]) -> Optional[str]:
+    """Predicts a transformed instance, None where 'depth' is exceeded."""
+    try:
+        return model.reverse_encode([model._evaluate(instance)])[0]
+    except MaxDepthExceededError:
+        return None  # One document cannot abort the run
+
+
+def _subtract(
+    totals: DefaultDict, held_out: DefaultDict, train_target: List[str]
+) -> Dict[str, Dict[str, Tuple[int, int]]]:
+    """Subtracts held-out word counts from the global aggregate.
+
+    Parameters
+    ----------
+    totals : DefaultDict
+        Global mapping of classification to word (count, positive) tuples
+
+    held_out : DefaultDict
+        Held-out mapping of classification to word (count, positive) tuples
+
+    train_target : List[str]
+        Array of training classifications
+
+    Returns
+    -------
+    Dict[str, Dict[str, Tuple[int, int]]]
+        Training mapping of classification to word (count, positive) tuples
+
+    """
+    by_class = dict()  # type: Dict[str, Dict[str, Tuple[int, int]]]
+    for cls in set(train_target):
+        removed = held_out.get(cls, {})
+        keywords = dict()  # type: Dict[str, Tuple[int, int]]
+        for word, (count, positive) in totals[cls].items():
+            held_count, held_positive = removed.get(word, (0, 0))
+            if count > held_count:
+                keywords[word] = (count - held_count, positive - held_positive)
+
+        by_class[cls] = keywords
+
+    return by_class